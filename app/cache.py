@@ -0,0 +1,54 @@
+import sqlite3
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".cache" / "beszel"
+CACHE_FILE = CACHE_DIR / "http.sqlite"
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL)"
+
+# Cap the store so it cannot grow unboundedly; trimming by rowid keeps the
+# most recently written entries, since INSERT OR REPLACE assigns fresh rowids.
+_MAX_ENTRIES = 512
+_TRIM = "DELETE FROM responses WHERE rowid NOT IN (SELECT rowid FROM responses ORDER BY rowid DESC LIMIT ?)"
+
+
+class ResponseCache:
+    """On-disk store of (url, etag, body) for conditional GET revalidation.
+
+    Entries are only ever served after the hub confirms them with a 304, so
+    this never returns stale data - it just turns repeated reads into
+    zero-body round trips.
+    """
+
+    def __init__(self, path: Path = CACHE_FILE) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.parent.chmod(0o700)
+        self._conn = sqlite3.connect(path)
+        path.chmod(0o600)  # Restrict permissions, like the config file
+        self._conn.execute(_SCHEMA)
+
+    def get(self, key: str) -> tuple[str, bytes] | None:
+        try:
+            row = self._conn.execute("SELECT etag, body FROM responses WHERE key = ?", (key,)).fetchone()
+        except (OSError, sqlite3.Error):  # e.g. locked by a concurrent invocation
+            return None
+        return (row[0], row[1]) if row else None
+
+    def put(self, key: str, etag: str, body: bytes) -> None:
+        try:
+            self._conn.execute("INSERT OR REPLACE INTO responses (key, etag, body) VALUES (?, ?, ?)", (key, etag, body))
+            self._conn.execute(_TRIM, (_MAX_ENTRIES,))
+            self._conn.commit()
+        except (OSError, sqlite3.Error):  # cache writes are best-effort
+            return
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def open_cache() -> ResponseCache | None:
+    """Open the shared response cache, or None if the cache dir is unusable."""
+    try:
+        return ResponseCache()
+    except (OSError, sqlite3.Error):
+        return None
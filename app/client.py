@@ -1,48 +1,267 @@
-from typing import Any
+import asyncio
+import atexit
+import os
+from collections.abc import Coroutine, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from app.cache import open_cache
+
+# The type checker always sees msgspec; at runtime it is optional (e.g. the
+# zipapp build cannot load C extensions) and typed listings fall back to dicts.
+if TYPE_CHECKING:
+    import msgspec
+
+    _has_msgspec: bool = True
+else:
+    try:
+        import msgspec
+
+        _has_msgspec = True
+    except ImportError:
+        _has_msgspec = False
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; asyncio's default loop works fine
+    uvloop = None  # type: ignore[assignment]
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None  # type: ignore[assignment]
+
+# Advertise brotli only when the optional decoder is actually importable,
+# so the hub never sends an encoding we cannot decompress.
+ACCEPT_ENCODING = "br, gzip" if brotli is not None else "gzip"
+
+try:
+    import msgpack
+except ImportError:  # msgpack is only needed for BESZEL_WIRE=msgpack
+    msgpack = None  # type: ignore[assignment]
+
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:  # orjson is optional; stdlib json keeps the CLI working
+    import json
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+
+class _IterStream:
+    """Minimal file-like wrapper so ijson can read from an httpx byte stream."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+
+    def read(self, size: int = -1) -> bytes:
+        if size == 0:  # ijson probes with read(0) to detect bytes vs str input
+            return b""
+        return next(self._chunks, b"")
+
+
+# The dataclass twins below only exist at runtime when msgspec is missing.
+if TYPE_CHECKING or _has_msgspec:
+
+    class System(msgspec.Struct, gc=False):
+        """Typed projection of a systems record, decoded at C speed by msgspec."""
+
+        id: str = ""
+        name: str = ""
+        host: str = ""
+        port: str | int = ""
+        status: str = "unknown"
+
+    class StatValues(msgspec.Struct, gc=False):
+        cpu: float = 0.0
+        mp: float = 0.0
+        dp: float = 0.0
+        mu: float = 0.0
+        b: list[float] = msgspec.field(default_factory=list)
+
+    class SystemStat(msgspec.Struct, gc=False):
+        created: str = ""
+        stats: StatValues | None = None
+
+    class _SystemPage(msgspec.Struct, gc=False):
+        items: list[System] = msgspec.field(default_factory=list)
+
+    class _StatPage(msgspec.Struct, gc=False):
+        items: list[SystemStat] = msgspec.field(default_factory=list)
+
+    _system_page_decoder = msgspec.json.Decoder(_SystemPage)
+    _stat_page_decoder = msgspec.json.Decoder(_StatPage)
+else:  # plain classes with the same shape, filled from dict decoding
+    from dataclasses import dataclass, field
+
+    @dataclass(slots=True)
+    class System:
+        id: str = ""
+        name: str = ""
+        host: str = ""
+        port: str | int = ""
+        status: str = "unknown"
+
+    @dataclass(slots=True)
+    class StatValues:
+        cpu: float = 0.0
+        mp: float = 0.0
+        dp: float = 0.0
+        mu: float = 0.0
+        b: list[float] = field(default_factory=list)
+
+    @dataclass(slots=True)
+    class SystemStat:
+        created: str = ""
+        stats: StatValues | None = None
+
+
+def _decode_systems(body: bytes) -> list[System]:
+    if _has_msgspec:
+        return _system_page_decoder.decode(body).items
+    return [
+        System(
+            id=item.get("id", ""),
+            name=item.get("name", ""),
+            host=item.get("host", ""),
+            port=item.get("port", ""),
+            status=item.get("status", "unknown"),
+        )
+        for item in _loads(body).get("items", [])
+    ]
+
+
+def _decode_stats(body: bytes) -> list[SystemStat]:
+    if _has_msgspec:
+        return _stat_page_decoder.decode(body).items
+    stats: list[SystemStat] = []
+    for item in _loads(body).get("items", []):
+        raw: dict[str, Any] = item.get("stats") or {}
+        values = StatValues(
+            cpu=raw.get("cpu", 0.0),
+            mp=raw.get("mp", 0.0),
+            dp=raw.get("dp", 0.0),
+            mu=raw.get("mu", 0.0),
+            b=raw.get("b", []),
+        )
+        stats.append(SystemStat(created=item.get("created", ""), stats=values))
+    return stats
+
+
+# Column subsets requested for table listings; --json-output paths fetch
+# full records instead.
+SYSTEM_LIST_FIELDS = "id,name,host,port,status"
+ALERT_LIST_FIELDS = "id,system,name,value,triggered,expand.system.name"
+CONTAINER_LIST_FIELDS = "id,name,cpu,memory,status,image"
+STAT_LIST_FIELDS = "created,stats"
+
+# Filter templates, interpolated with str.__mod__ on the hot path.
+_SYSTEM_FILTER = 'system="%s"'
+_SYSTEM_TYPE_FILTER = 'system="%s" && type="%s"'
+
+
+def _list_params(
+    page: int = 1,
+    per_page: int = 200,
+    sort: str = "",
+    filter_expr: str = "",
+    expand: str = "",
+    fields: str = "",
+) -> dict[str, Any]:
+    """Build PocketBase listing query params, shared by both clients."""
+    params: dict[str, Any] = {"page": page, "perPage": per_page}
+    if sort:
+        params["sort"] = sort
+    if filter_expr:
+        params["filter"] = filter_expr
+    if expand:
+        params["expand"] = expand
+    if fields:
+        params["fields"] = fields
+    return params
+
+
+# Shared across all clients in the process so back-to-back requests reuse
+# one TLS session instead of re-handshaking per call.
+_TRANSPORT = httpx.HTTPTransport(
+    retries=1,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30),
+)
+
 
 class BeszelClient:
-    def __init__(self, base_url: str, token: str | None = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        client: httpx.Client | None = None,
+        shared: bool = False,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.token = token
-        self._client = httpx.Client(timeout=30.0)
-
-    def _headers(self) -> dict[str, str]:
-        headers: dict[str, str] = {"Content-Type": "application/json"}
-        if self.token:
-            headers["Authorization"] = self.token
-        return headers
+        self._client = client or httpx.Client(
+            base_url=self.base_url,
+            transport=_TRANSPORT,
+            timeout=30.0,
+            headers={"Content-Type": "application/json", "Accept-Encoding": ACCEPT_ENCODING},
+        )
+        if token:
+            self._client.headers["Authorization"] = token
+        # Opt-in binary wire format: ask for msgpack and fall back per
+        # response, so hubs that ignore the Accept header keep working.
+        if msgpack is not None and os.environ.get("BESZEL_WIRE") == "msgpack":
+            self._client.headers["Accept"] = "application/msgpack"
+        self._cache = open_cache()
+        self._shared = shared
+
+    def _json(self, response: httpx.Response) -> Any:
+        if msgpack is not None and response.headers.get("content-type", "").startswith("application/msgpack"):
+            return msgpack.unpackb(response.content, raw=False)
+        return _loads(response.content)
 
     def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        response = self._client.get(f"{self.base_url}{path}", headers=self._headers(), params=params)
+        request = self._client.build_request("GET", path, params=params)
+        cached = self._cache.get(str(request.url)) if self._cache else None
+        if cached:
+            request.headers["If-None-Match"] = cached[0]
+        response = self._client.send(request)
+        if cached and response.status_code == 304:
+            return _loads(cached[1])  # type: ignore[no-any-return]
         response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+        etag = response.headers.get("etag")
+        if self._cache and etag and response.headers.get("content-type", "").startswith("application/json"):
+            self._cache.put(str(request.url), etag, response.content)
+        return self._json(response)  # type: ignore[no-any-return]
 
     def _post(self, path: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
-        response = self._client.post(f"{self.base_url}{path}", json=data or {}, headers=self._headers())
+        response = self._client.post(path, json=data or {})
         response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+        return self._json(response)  # type: ignore[no-any-return]
 
     def _patch(self, path: str, data: dict[str, Any]) -> dict[str, Any]:
-        response = self._client.patch(f"{self.base_url}{path}", json=data, headers=self._headers())
+        response = self._client.patch(path, json=data)
         response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+        return self._json(response)  # type: ignore[no-any-return]
 
     def _delete(self, path: str) -> None:
-        response = self._client.delete(f"{self.base_url}{path}", headers=self._headers())
+        response = self._client.delete(path)
         response.raise_for_status()
 
     # Authentication
     def login(self, email: str, password: str) -> str:
         response = self._client.post(
-            f"{self.base_url}/api/collections/users/auth-with-password",
+            "/api/collections/users/auth-with-password",
             json={"identity": email, "password": password},
-            headers={"Content-Type": "application/json"},
         )
         response.raise_for_status()
-        self.token = response.json()["token"]
+        self.token = self._json(response)["token"]
+        self._client.headers["Authorization"] = self.token  # type: ignore[index]
         return self.token  # type: ignore[return-value]
 
     def auth_refresh(self) -> dict[str, Any]:
@@ -61,16 +280,96 @@ class BeszelClient:
         sort: str = "",
         filter_expr: str = "",
         expand: str = "",
+        fields: str = "",
     ) -> dict[str, Any]:
-        params: dict[str, Any] = {"page": page, "perPage": per_page}
-        if sort:
-            params["sort"] = sort
-        if filter_expr:
-            params["filter"] = filter_expr
-        if expand:
-            params["expand"] = expand
+        params = _list_params(page, per_page, sort, filter_expr, expand, fields)
         return self._get(f"/api/collections/{collection}/records", params)
 
+    def list_all_records(
+        self,
+        collection: str,
+        per_page: int = 200,
+        sort: str = "",
+        filter_expr: str = "",
+        expand: str = "",
+        fields: str = "",
+    ) -> list[dict[str, Any]]:
+        """Fetch every page of a listing, fanning out page requests concurrently.
+
+        Page 1 is fetched first to learn totalPages; the remaining pages are
+        requested in parallel over one HTTP/2 connection, so wall time stays
+        close to a single round trip instead of one per page.
+        """
+        first = self.list_records(
+            collection, page=1, per_page=per_page, sort=sort, filter_expr=filter_expr, expand=expand, fields=fields
+        )
+        items: list[dict[str, Any]] = first.get("items", [])
+        total_pages: int = first.get("totalPages", 1)
+        if total_pages <= 1:
+            return items
+        pages = range(2, total_pages + 1)
+        rest = run_async(self._fetch_pages(collection, pages, per_page, sort, filter_expr, expand, fields))
+        for page_items in rest:
+            items.extend(page_items)
+        return items
+
+    async def _fetch_pages(
+        self,
+        collection: str,
+        pages: Iterable[int],
+        per_page: int,
+        sort: str,
+        filter_expr: str,
+        expand: str,
+        fields: str = "",
+    ) -> list[list[dict[str, Any]]]:
+        headers = {"Content-Type": "application/json", "Accept-Encoding": ACCEPT_ENCODING}
+        if self.token:
+            headers["Authorization"] = self.token
+        async with httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            timeout=30.0,
+            headers=headers,
+            limits=httpx.Limits(max_keepalive_connections=16),
+        ) as client:
+
+            async def fetch(page: int) -> list[dict[str, Any]]:
+                params = _list_params(page, per_page, sort, filter_expr, expand, fields)
+                response = await client.get(f"/api/collections/{collection}/records", params=params)
+                response.raise_for_status()
+                return _loads(response.content).get("items", [])  # type: ignore[no-any-return]
+
+            return list(await asyncio.gather(*(fetch(page) for page in pages)))
+
+    def stream_items(
+        self,
+        collection: str,
+        per_page: int = 200,
+        sort: str = "",
+        filter_expr: str = "",
+        expand: str = "",
+        fields: str = "",
+    ) -> Iterator[dict[str, Any]]:
+        """Yield listing records one at a time without buffering the full body.
+
+        Parses the response incrementally with ijson, so peak memory stays at
+        one record regardless of page size and the first record is available
+        as soon as it arrives.
+        """
+        import ijson
+
+        params = _list_params(per_page=per_page, sort=sort, filter_expr=filter_expr, expand=expand, fields=fields)
+        # The incremental parser only speaks JSON, so pin Accept for streams.
+        with self._client.stream(
+            "GET",
+            f"/api/collections/{collection}/records",
+            params=params,
+            headers={"Accept": "application/json"},
+        ) as response:
+            response.raise_for_status()
+            yield from ijson.items(_IterStream(response.iter_bytes()), "items.item")
+
     def get_record(self, collection: str, record_id: str, expand: str = "") -> dict[str, Any]:
         params: dict[str, Any] = {}
         if expand:
@@ -87,10 +386,24 @@ class BeszelClient:
         self._delete(f"/api/collections/{collection}/records/{record_id}")
 
     # Systems
-    def get_systems(self, filter_expr: str = "") -> list[dict[str, Any]]:
-        result = self.list_records("systems", per_page=200, filter_expr=filter_expr)
+    def get_systems(self, filter_expr: str = "", fetch_all: bool = False, fields: str = "") -> list[dict[str, Any]]:
+        if fetch_all:
+            return self.list_all_records("systems", per_page=200, filter_expr=filter_expr, fields=fields)
+        result = self.list_records("systems", per_page=200, filter_expr=filter_expr, fields=fields)
         return result.get("items", [])  # type: ignore[no-any-return]
 
+    def stream_systems(self, filter_expr: str = "") -> Iterator[dict[str, Any]]:
+        return self.stream_items("systems", per_page=200, filter_expr=filter_expr, fields=SYSTEM_LIST_FIELDS)
+
+    def get_systems_typed(self, filter_expr: str = "") -> list[System]:
+        """Decode the systems listing straight into System structs."""
+        params = _list_params(per_page=200, filter_expr=filter_expr, fields=SYSTEM_LIST_FIELDS)
+        response = self._client.get(
+            "/api/collections/systems/records", params=params, headers={"Accept": "application/json"}
+        )
+        response.raise_for_status()
+        return _decode_systems(response.content)
+
     def get_system(self, system_id: str) -> dict[str, Any]:
         return self.get_record("systems", system_id)
 
@@ -109,15 +422,36 @@ class BeszelClient:
         system_id: str,
         record_type: str = "1m",
         per_page: int = 30,
+        fields: str = "",
     ) -> list[dict[str, Any]]:
         result = self.list_records(
             "system_stats",
             per_page=per_page,
             sort="-created",
-            filter_expr=f'system="{system_id}" && type="{record_type}"',
+            filter_expr=_SYSTEM_TYPE_FILTER % (system_id, record_type),
+            fields=fields,
         )
         return result.get("items", [])  # type: ignore[no-any-return]
 
+    def get_system_stats_typed(
+        self,
+        system_id: str,
+        record_type: str = "1m",
+        per_page: int = 30,
+    ) -> list[SystemStat]:
+        """Decode the stats listing straight into SystemStat structs."""
+        params = _list_params(
+            per_page=per_page,
+            sort="-created",
+            filter_expr=_SYSTEM_TYPE_FILTER % (system_id, record_type),
+            fields=STAT_LIST_FIELDS,
+        )
+        response = self._client.get(
+            "/api/collections/system_stats/records", params=params, headers={"Accept": "application/json"}
+        )
+        response.raise_for_status()
+        return _decode_stats(response.content)
+
     # Container Stats
     def get_container_stats(
         self,
@@ -128,16 +462,22 @@ class BeszelClient:
             "container_stats",
             per_page=per_page,
             sort="-created",
-            filter_expr=f'system="{system_id}"',
+            filter_expr=_SYSTEM_FILTER % system_id,
         )
         return result.get("items", [])  # type: ignore[no-any-return]
 
     # Alerts
     def get_alerts(self, system_id: str = "") -> list[dict[str, Any]]:
-        filter_expr = f'system="{system_id}"' if system_id else ""
+        filter_expr = _SYSTEM_FILTER % system_id if system_id else ""
         result = self.list_records("alerts", per_page=200, filter_expr=filter_expr, expand="system")
         return result.get("items", [])  # type: ignore[no-any-return]
 
+    def stream_alerts(self, system_id: str = "") -> Iterator[dict[str, Any]]:
+        filter_expr = _SYSTEM_FILTER % system_id if system_id else ""
+        return self.stream_items(
+            "alerts", per_page=200, filter_expr=filter_expr, expand="system", fields=ALERT_LIST_FIELDS
+        )
+
     def get_alert(self, alert_id: str) -> dict[str, Any]:
         return self.get_record("alerts", alert_id, expand="system")
 
@@ -157,10 +497,14 @@ class BeszelClient:
 
     # Containers
     def get_containers(self, system_id: str = "") -> list[dict[str, Any]]:
-        filter_expr = f'system="{system_id}"' if system_id else ""
+        filter_expr = _SYSTEM_FILTER % system_id if system_id else ""
         result = self.list_records("containers", per_page=200, filter_expr=filter_expr)
         return result.get("items", [])  # type: ignore[no-any-return]
 
+    def stream_containers(self, system_id: str = "") -> Iterator[dict[str, Any]]:
+        filter_expr = _SYSTEM_FILTER % system_id if system_id else ""
+        return self.stream_items("containers", per_page=200, filter_expr=filter_expr, fields=CONTAINER_LIST_FIELDS)
+
     def get_container_logs(self, system_id: str, container_id: str) -> str:
         result = self._get("/api/beszel/containers/logs", {"system": system_id, "container": container_id})
         return result.get("logs", "")  # type: ignore[no-any-return]
@@ -169,10 +513,99 @@ class BeszelClient:
         return self._get("/api/beszel/containers/info", {"system": system_id, "container": container_id})
 
     def close(self) -> None:
+        if self._cache:
+            self._cache.close()
         self._client.close()
 
     def __enter__(self) -> "BeszelClient":
         return self
 
     def __exit__(self, *_args: object) -> None:
-        self.close()
+        # The shared client outlives individual commands; atexit closes it.
+        if not self._shared:
+            self.close()
+
+
+def run_async[T](coro: Coroutine[Any, Any, T]) -> T:
+    """asyncio.run, switched to uvloop's faster event loop when installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+class AsyncBeszelClient:
+    """Async counterpart to BeszelClient for commands that fan out several GETs.
+
+    Concurrent calls share one HTTP/2 connection, so N requests cost roughly
+    one round trip instead of N. The sync commands keep using BeszelClient.
+    """
+
+    def __init__(self, base_url: str, token: str | None = None, client: httpx.AsyncClient | None = None) -> None:
+        self.base_url = base_url.rstrip("/")
+        headers = {"Content-Type": "application/json", "Accept-Encoding": ACCEPT_ENCODING}
+        if token:
+            headers["Authorization"] = token
+        self._client = client or httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            timeout=30.0,
+            headers=headers,
+        )
+
+    async def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        response = await self._client.get(path, params=params)
+        response.raise_for_status()
+        return _loads(response.content)  # type: ignore[no-any-return]
+
+    async def list_records(
+        self,
+        collection: str,
+        page: int = 1,
+        per_page: int = 200,
+        sort: str = "",
+        filter_expr: str = "",
+        expand: str = "",
+        fields: str = "",
+    ) -> dict[str, Any]:
+        params = _list_params(page, per_page, sort, filter_expr, expand, fields)
+        return await self._get(f"/api/collections/{collection}/records", params)
+
+    async def get_systems(self, filter_expr: str = "", fields: str = "") -> list[dict[str, Any]]:
+        result = await self.list_records("systems", per_page=200, filter_expr=filter_expr, fields=fields)
+        return result.get("items", [])  # type: ignore[no-any-return]
+
+    async def get_alerts(self, system_id: str = "", fields: str = "") -> list[dict[str, Any]]:
+        filter_expr = _SYSTEM_FILTER % system_id if system_id else ""
+        result = await self.list_records(
+            "alerts", per_page=200, filter_expr=filter_expr, expand="system", fields=fields
+        )
+        return result.get("items", [])  # type: ignore[no-any-return]
+
+    async def get_alert_history(self, per_page: int = 50) -> list[dict[str, Any]]:
+        result = await self.list_records("alerts_history", per_page=per_page, sort="-created")
+        return result.get("items", [])  # type: ignore[no-any-return]
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncBeszelClient":
+        return self
+
+    async def __aexit__(self, *_args: object) -> None:
+        await self.aclose()
+
+
+_shared_client: BeszelClient | None = None
+
+
+def get_shared(base_url: str, token: str | None = None) -> BeszelClient:
+    """Return a process-wide client, created on first use and closed at exit.
+
+    Keeps the underlying connection pool alive across commands issued in the
+    same process instead of tearing it down per command.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = BeszelClient(base_url, token, shared=True)
+        atexit.register(_shared_client.close)
+    return _shared_client
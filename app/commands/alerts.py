@@ -0,0 +1,101 @@
+from typing import Any, NamedTuple
+
+import click
+
+from app.cli import get_client
+from app.render import ColumnSpec, cell, emit_json, ok, print_table
+
+ALERTS_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("ID", "cyan"),
+    ("System", "green"),
+    ("Name", "bold"),
+    ("Value", "yellow"),
+    ("Triggered", "dim"),
+)
+
+_ALERT_HISTORY_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("ID", "cyan"),
+    ("Created", "dim"),
+    ("User", "green"),
+)
+
+
+class _AlertRow(NamedTuple):
+    id: str
+    system: str
+    name: str
+    value: str
+    triggered: str
+
+
+def alert_row(alert: dict[str, Any]) -> _AlertRow:
+    expanded = alert.get("expand", {}) or {}
+    system_name = ""
+    if expanded.get("system"):
+        system_name = expanded["system"].get("name", "")
+    return _AlertRow(
+        cell(alert.get("id", "")),
+        system_name or cell(alert.get("system", "")),
+        cell(alert.get("name", "")),
+        cell(alert.get("value", "")),
+        cell(alert.get("triggered", "")),
+    )
+
+
+@click.command()
+@click.option("--system", "-s", "system_id", default="", help="Filter by system ID")
+@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
+def alerts(system_id: str, json_output: bool) -> None:
+    """List alerts."""
+    with get_client() as client:
+        if json_output:
+            emit_json(client.get_alerts(system_id))
+            return
+        print_table("Alerts", ALERTS_COLUMNS, map(alert_row, client.stream_alerts(system_id)), "No alerts found")
+
+
+@click.command("alert-create")
+@click.argument("system_id")
+@click.argument("name", type=click.Choice(["CPU", "Memory", "Disk", "Bandwidth", "LoadAvg5", "Status"]))
+@click.argument("value", type=float)
+@click.option("--min", "-m", "min_val", type=float, default=10, help="Minimum duration in minutes (default: 10)")
+def alert_create(system_id: str, name: str, value: float, min_val: float) -> None:
+    """Create an alert for a system."""
+    with get_client() as client:
+        user = client.get_current_user()
+        data = {
+            "system": system_id,
+            "user": user["id"],
+            "name": name,
+            "value": value,
+            "min": min_val,
+        }
+        alert = client.create_alert(data)
+        ok(f"Alert created: {name} > {value} on {system_id} (id: {alert.get('id')})")
+
+
+@click.command("alert-delete")
+@click.argument("alert_id")
+@click.confirmation_option(prompt="Are you sure you want to delete this alert?")
+def alert_delete(alert_id: str) -> None:
+    """Delete an alert."""
+    with get_client() as client:
+        client.delete_alert(alert_id)
+        ok("Alert deleted")
+
+
+@click.command("alert-history")
+@click.option("--limit", "-l", default=50, help="Number of records to show")
+@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
+def alert_history(limit: int, json_output: bool) -> None:
+    """Show alert history."""
+    with get_client() as client:
+        history = client.get_alert_history(limit)
+        if json_output:
+            emit_json(history)
+            return
+        rows = (
+            (cell(entry.get("id", "")), cell(entry.get("created", "")), cell(entry.get("user", "")))
+            for entry in history
+        )
+        print_table("Alert History", _ALERT_HISTORY_COLUMNS, rows, "No alert history found")
@@ -0,0 +1,74 @@
+import click
+
+from app import config
+from app.cli import get_client
+from app.render import console, ok
+
+
+@click.command()
+@click.option("--url", "-s", help="Beszel hub URL")
+@click.option("--email", "-e", help="Email address")
+@click.option("--password", "-p", help="Password", hide_input=True)
+def login(url: str | None, email: str | None, password: str | None) -> None:
+    """Login and save credentials."""
+    from app.client import BeszelClient
+
+    if not url:
+        current_url = config.get_url()
+        if current_url:
+            url = click.prompt("Beszel URL", default=current_url)
+        else:
+            url = click.prompt("Beszel URL (e.g. https://beszel.example.com)")
+    config.set_url(url)
+
+    if not email:
+        email = click.prompt("Email")
+    if not password:
+        password = click.prompt("Password", hide_input=True)
+
+    client = BeszelClient(url)
+    token = client.login(email, password)
+    client.close()
+
+    config.set_token(token)
+    ok("Login successful!")
+    print(f"Config saved to {config.CONFIG_FILE}")
+
+
+@click.command()
+def logout() -> None:
+    """Clear saved credentials."""
+    config.clear_config()
+    ok("Logged out - credentials cleared")
+
+
+@click.command("config-show")
+def config_show() -> None:
+    """Show current configuration."""
+    console().print(f"[bold]Config file:[/bold] {config.CONFIG_FILE}")
+    url = config.get_url()
+    console().print(f"[bold]URL:[/bold] {url or '[dim]not set[/dim]'}")
+    token = config.get_token()
+    if token:
+        console().print(f"[bold]Token:[/bold] {token[:20]}...")
+    else:
+        console().print("[bold]Token:[/bold] [dim]not set[/dim]")
+
+
+@click.command("config-set-url")
+@click.argument("url")
+def config_set_url(url: str) -> None:
+    """Set the Beszel hub URL."""
+    config.set_url(url)
+    ok(f"URL set to {url}")
+
+
+@click.command("whoami")
+def whoami() -> None:
+    """Show current user info."""
+    with get_client() as client:
+        user = client.get_current_user()
+        console().print(f"[bold]Email:[/bold] {user.get('email')}")
+        console().print(f"[bold]Name:[/bold] {user.get('name')}")
+        console().print(f"[bold]ID:[/bold] {user.get('id')}")
+        console().print(f"[bold]Role:[/bold] {user.get('role', 'user')}")
@@ -0,0 +1,76 @@
+from typing import Any, NamedTuple
+
+import click
+
+from app.cli import get_client
+from app.render import ColumnSpec, cell, emit_json, err, print_table
+
+_CONTAINERS_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("Name", "green"),
+    ("CPU %", "cyan"),
+    ("Memory", "yellow"),
+    ("Status", "dim"),
+    ("Image", "dim", 40),
+)
+
+
+class _ContainerRow(NamedTuple):
+    name: str
+    cpu: str
+    memory: str
+    status: str
+    image: str
+
+
+def _container_row(c: dict[str, Any]) -> _ContainerRow:
+    mem_mb = c.get("memory", 0)
+    return _ContainerRow(
+        cell(c.get("name", "")),
+        f"{c.get('cpu', 0):.2f}",
+        f"{mem_mb:.0f} MB" if mem_mb else "0 MB",
+        cell(c.get("status", "")),
+        cell(c.get("image", "")),
+    )
+
+
+@click.command()
+@click.argument("system_id")
+@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
+def containers(system_id: str, json_output: bool) -> None:
+    """List containers for a system."""
+    with get_client() as client:
+        if json_output:
+            emit_json(client.get_containers(system_id))
+            return
+        print_table(
+            "Containers",
+            _CONTAINERS_COLUMNS,
+            map(_container_row, client.stream_containers(system_id)),
+            "No containers found",
+        )
+
+
+@click.command("logs")
+@click.argument("system_id")
+@click.argument("container")
+@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
+def logs(system_id: str, container: str, json_output: bool) -> None:
+    """Show container logs. CONTAINER can be a name or Docker ID."""
+    with get_client() as client:
+        # If container looks like a name (not a hex ID), resolve it
+        container_id = container
+        if not all(c in "0123456789abcdef" for c in container.lower()):
+            container_list = client.get_containers(system_id)
+            matches = [c for c in container_list if c.get("name") == container]
+            if not matches:
+                err(f"Container '{container}' not found on system {system_id}")
+                raise SystemExit(1)
+            container_id = matches[0].get("id", container)
+        log_output = client.get_container_logs(system_id, container_id)
+        if json_output:
+            emit_json({"logs": log_output})
+            return
+        if not log_output:
+            print("No logs found")
+            return
+        print(log_output)
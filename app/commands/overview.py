@@ -0,0 +1,33 @@
+import asyncio
+from typing import Any
+
+import click
+
+from app.cli import get_client
+from app.client import ALERT_LIST_FIELDS, SYSTEM_LIST_FIELDS, AsyncBeszelClient, run_async
+from app.commands.alerts import ALERTS_COLUMNS, alert_row
+from app.commands.systems import SYSTEMS_COLUMNS, sys_row
+from app.render import console, emit_json, print_table
+
+
+async def _fetch(base_url: str, token: str | None, full: bool) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    async with AsyncBeszelClient(base_url, token) as client:
+        return await asyncio.gather(
+            client.get_systems(fields="" if full else SYSTEM_LIST_FIELDS),
+            client.get_alerts(fields="" if full else ALERT_LIST_FIELDS),
+        )
+
+
+@click.command()
+@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
+def overview(json_output: bool) -> None:
+    """Show systems and alerts together, fetched concurrently."""
+    client = get_client()
+    systems, alerts = run_async(_fetch(client.base_url, client.token, json_output))
+    if json_output:
+        emit_json({"systems": systems, "alerts": alerts})
+        return
+    up = sum(1 for sys in systems if sys.get("status") == "up")
+    console().print(f"[dim]{up}/{len(systems)} systems up, {len(alerts)} alerts[/dim]")
+    print_table("Systems", SYSTEMS_COLUMNS, map(sys_row, systems), "No systems found")
+    print_table("Alerts", ALERTS_COLUMNS, map(alert_row, alerts), "No alerts found")
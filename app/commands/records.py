@@ -0,0 +1,52 @@
+from collections.abc import Iterator
+
+import click
+
+from app.cli import get_client
+from app.render import ColumnSpec, cell, console, emit_json, print_table
+
+
+@click.command("records")
+@click.argument("collection")
+@click.option("--filter", "-f", "filter_expr", default="", help="PocketBase filter expression")
+@click.option("--sort", "-s", "sort_expr", default="", help="Sort expression (e.g. -created)")
+@click.option("--limit", "-l", default=30, help="Number of records")
+@click.option("--expand", "-e", default="", help="Relations to expand")
+@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
+def records(collection: str, filter_expr: str, sort_expr: str, limit: int, expand: str, json_output: bool) -> None:
+    """List records from any PocketBase collection."""
+    with get_client() as client:
+        result = client.list_records(collection, per_page=limit, sort=sort_expr, filter_expr=filter_expr, expand=expand)
+        items = result.get("items", [])
+        if json_output:
+            emit_json(items)
+            return
+        if not items:
+            console().print("[dim]No records found[/dim]")
+            return
+        # Auto-detect columns from the first record in a single items() scan
+        columns: list[str] = []
+        for key, value in items[0].items():
+            if type(value) not in (dict, list):
+                columns.append(key)
+                if len(columns) == 8:
+                    break
+        specs: tuple[ColumnSpec, ...] = tuple((col, "cyan" if col == "id" else "") for col in columns)
+
+        def rows() -> Iterator[tuple[str, ...]]:
+            for item in items:
+                get = item.get
+                yield tuple(cell(get(col, "")) for col in columns)
+
+        print_table(f"{collection} ({result.get('totalItems', '?')} total)", specs, rows())
+
+
+@click.command("record")
+@click.argument("collection")
+@click.argument("record_id")
+@click.option("--expand", "-e", default="", help="Relations to expand")
+def record_show(collection: str, record_id: str, expand: str) -> None:
+    """Show a single record from any collection."""
+    with get_client() as client:
+        rec = client.get_record(collection, record_id, expand=expand)
+        emit_json(rec)
@@ -0,0 +1,198 @@
+import sys as _stdsys
+from typing import Any, NamedTuple
+
+import click
+
+from app.cli import get_client
+from app.client import SYSTEM_LIST_FIELDS, StatValues, System, SystemStat
+from app.render import ColumnSpec, cell, console, emit_json, format_bytes, ok, print_table, warn
+
+SYSTEMS_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("ID", "cyan"),
+    ("Name", "green"),
+    ("Host", "dim"),
+    ("Port", "dim"),
+    ("Status", "bold"),
+)
+
+_STATUS_STYLE = {"up": "green", "down": "red"}
+_DEFAULT_STATUS_STYLE = "yellow"
+# Pre-rendered cells for the common statuses so rows skip re-formatting.
+_STATUS_CELL = {status: f"[{style}]{status}[/{style}]" for status, style in _STATUS_STYLE.items()}
+
+
+def _status_cell(status: str) -> str:
+    """Status text, colorized only when rendering to a terminal.
+
+    Piped output must stay plain so real data is never mistaken for markup.
+    """
+    if not _stdsys.stdout.isatty():
+        return status
+    return _STATUS_CELL.get(status) or f"[{_DEFAULT_STATUS_STYLE}]{status}[/{_DEFAULT_STATUS_STYLE}]"
+
+
+_STATS_COLUMNS: tuple[ColumnSpec, ...] = (
+    ("Time", "dim"),
+    ("CPU %", "cyan"),
+    ("Mem %", "green"),
+    ("Disk %", "yellow"),
+    ("Mem Used", "dim"),
+    ("BW Sent/s", "dim"),
+    ("BW Recv/s", "dim"),
+)
+
+
+class _SysRow(NamedTuple):
+    id: str
+    name: str
+    host: str
+    port: str
+    status: str
+
+
+def sys_row(sys: dict[str, Any]) -> _SysRow:
+    status = sys.get("status", "unknown")
+    return _SysRow(
+        cell(sys.get("id")),
+        cell(sys.get("name")),
+        cell(sys.get("host", "")),
+        cell(sys.get("port", "")),
+        _status_cell(status),
+    )
+
+
+class _StatRow(NamedTuple):
+    time: str
+    cpu: str
+    mem: str
+    disk: str
+    mem_used: str
+    bw_sent: str
+    bw_recv: str
+
+
+def _sys_row_typed(sys: System) -> _SysRow:
+    return _SysRow(
+        sys.id,
+        sys.name,
+        sys.host,
+        cell(sys.port),
+        _status_cell(sys.status),
+    )
+
+
+def _stat_row(rec: SystemStat) -> _StatRow:
+    s = rec.stats or StatValues()
+    bw = s.b
+    return _StatRow(
+        rec.created,
+        f"{s.cpu:.1f}",
+        f"{s.mp:.1f}",
+        f"{s.dp:.1f}",
+        f"{s.mu:.2f} GB",
+        format_bytes(bw[0] if len(bw) > 0 else 0) + "/s",
+        format_bytes(bw[1] if len(bw) > 1 else 0) + "/s",
+    )
+
+
+@click.command()
+@click.option("--filter", "-f", "filter_expr", default="", help="PocketBase filter expression")
+@click.option("--all", "-a", "fetch_all", is_flag=True, help="Fetch every page, not just the first 200")
+@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
+def systems(filter_expr: str, fetch_all: bool, json_output: bool) -> None:
+    """List all monitored systems."""
+    with get_client() as client:
+        if json_output:
+            emit_json(client.get_systems(filter_expr, fetch_all=fetch_all))
+            return
+        if fetch_all:
+            rows = map(sys_row, client.get_systems(filter_expr, fetch_all=True, fields=SYSTEM_LIST_FIELDS))
+        else:
+            rows = map(_sys_row_typed, client.get_systems_typed(filter_expr))
+        print_table("Systems", SYSTEMS_COLUMNS, rows)
+
+
+@click.command("system")
+@click.argument("system_id")
+@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
+def system_show(system_id: str, json_output: bool) -> None:
+    """Show system details."""
+    with get_client() as client:
+        sys = client.get_system(system_id)
+        if json_output:
+            emit_json(sys)
+            return
+        status = sys.get("status", "unknown")
+        status_style = _STATUS_STYLE.get(status, _DEFAULT_STATUS_STYLE)
+        console().print(f"[bold cyan]System: {sys.get('name')}[/bold cyan]")
+        console().print(f"[bold]ID:[/bold] {sys.get('id')}")
+        console().print(f"[bold]Host:[/bold] {sys.get('host')}")
+        console().print(f"[bold]Port:[/bold] {sys.get('port')}")
+        console().print(f"[bold]Status:[/bold] [{status_style}]{status}[/{status_style}]")
+
+        info = sys.get("info", {}) or {}
+        if info:
+            console().print("\n[bold]System Info:[/bold]")
+            if info.get("h"):
+                console().print(f"  Hostname: {info['h']}")
+            if info.get("m"):
+                console().print(f"  CPU Model: {info['m']}")
+            if info.get("c"):
+                console().print(f"  Cores: {info['c']} ({info.get('t', '')} threads)")
+            if info.get("k"):
+                console().print(f"  Kernel: {info['k']}")
+            if info.get("v"):
+                console().print(f"  Agent Version: {info['v']}")
+            if info.get("cpu") is not None:
+                console().print(f"  CPU: {info['cpu']:.1f}%")
+            if info.get("mp") is not None:
+                console().print(f"  Memory: {info['mp']:.1f}%")
+            if info.get("dp") is not None:
+                console().print(f"  Disk: {info['dp']:.1f}%")
+
+
+@click.command("system-update")
+@click.argument("system_id")
+@click.option("--name", "-n", help="New name")
+@click.option("--host", help="New host")
+@click.option("--port", type=int, help="New port")
+def system_update(system_id: str, name: str | None, host: str | None, port: int | None) -> None:
+    """Update a system."""
+    with get_client() as client:
+        data: dict[str, Any] = {}
+        if name:
+            data["name"] = name
+        if host:
+            data["host"] = host
+        if port:
+            data["port"] = port
+        if not data:
+            warn("No updates provided")
+            return
+        sys = client.update_system(system_id, data)
+        ok(f"Updated system: {sys.get('name')}")
+
+
+@click.command("system-delete")
+@click.argument("system_id")
+@click.confirmation_option(prompt="Are you sure you want to delete this system?")
+def system_delete(system_id: str) -> None:
+    """Delete a system."""
+    with get_client() as client:
+        client.delete_system(system_id)
+        ok("System deleted")
+
+
+@click.command("stats")
+@click.argument("system_id")
+@click.option("--type", "-t", "record_type", default="1m", type=click.Choice(["1m", "10m", "20m", "120m", "480m"]))
+@click.option("--limit", "-l", default=10, help="Number of records to show")
+@click.option("--json-output", "-j", is_flag=True, help="Output as JSON")
+def stats(system_id: str, record_type: str, limit: int, json_output: bool) -> None:
+    """Show system stats history."""
+    with get_client() as client:
+        if json_output:
+            emit_json(client.get_system_stats(system_id, record_type, limit))
+            return
+        records = client.get_system_stats_typed(system_id, record_type, limit)
+        print_table(f"System Stats ({record_type})", _STATS_COLUMNS, map(_stat_row, records), "No stats found")
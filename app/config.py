@@ -1,3 +1,4 @@
+import functools
 import json
 from pathlib import Path
 from typing import Any
@@ -20,8 +21,16 @@ def save_config(config: dict[str, Any]) -> None:
     with open(CONFIG_FILE, "w") as f:
         json.dump(config, f, indent=2)
     CONFIG_FILE.chmod(0o600)  # Restrict permissions
+    _clear_caches()
 
 
+def _clear_caches() -> None:
+    """Drop memoized reads after the config file changes."""
+    get_token.cache_clear()
+    get_url.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
 def get_token() -> str | None:
     """Get stored auth token."""
     return load_config().get("token")
@@ -34,6 +43,7 @@ def set_token(token: str) -> None:
     save_config(config)
 
 
+@functools.lru_cache(maxsize=1)
 def get_url() -> str | None:
     """Get stored URL."""
     return load_config().get("url")
@@ -50,3 +60,4 @@ def clear_config() -> None:
     """Clear stored config."""
     if CONFIG_FILE.exists():
         CONFIG_FILE.unlink()
+    _clear_caches()
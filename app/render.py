@@ -0,0 +1,125 @@
+import sys
+from collections.abc import Iterable
+from itertools import chain
+from typing import TYPE_CHECKING, Any, TextIO
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json keeps the CLI working
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+# (header, style) or (header, style, max_width)
+ColumnSpec = tuple[str, str] | tuple[str, str, int]
+
+_console_instance: "Console | None" = None
+
+
+def console() -> "Console":
+    """Rich console, created on first use so simple commands skip the import."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+
+        if sys.stdout.isatty():
+            _console_instance = Console()
+        else:
+            _console_instance = Console(no_color=True, highlight=False)
+    return _console_instance
+
+
+def _ansi(code: str, message: str, stream: "TextIO" = sys.stdout) -> str:
+    """Wrap a message in an ANSI color code when the target stream is a terminal."""
+    if stream.isatty():
+        return f"\x1b[{code}m{message}\x1b[0m"
+    return message
+
+
+def ok(message: str) -> None:
+    print(_ansi("32", message))
+
+
+def warn(message: str) -> None:
+    print(_ansi("33", message))
+
+
+def err(message: str) -> None:
+    print(_ansi("31", message, sys.stderr), file=sys.stderr)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to pretty-printed JSON, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+    import json
+
+    return json.dumps(obj, indent=2, default=str)
+
+
+def emit_json(obj: Any) -> None:
+    """Write pretty-printed JSON straight to stdout, bypassing Rich's highlighter."""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str) + b"\n")
+        return
+    sys.stdout.write(_dumps(obj) + "\n")
+
+
+def cell(value: Any) -> str:
+    """Stringify a table cell, short-circuiting the common already-a-str case."""
+    if type(value) is str:
+        return value
+    return "" if value is None else str(value)
+
+
+def _make_table(title: str, columns: tuple[ColumnSpec, ...]) -> "Table":
+    """Build a Rich table from a precomputed column schema."""
+    from rich.table import Table
+
+    table = Table(title=title)
+    for spec in columns:
+        table.add_column(spec[0], style=spec[1], max_width=spec[2] if len(spec) == 3 else None)
+    return table
+
+
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+def print_table(
+    title: str,
+    columns: tuple[ColumnSpec, ...],
+    rows: Iterable[tuple[str, ...]],
+    empty_message: str = "",
+) -> None:
+    """Render rows as a Rich table on a terminal, or as plain TSV when piped."""
+    rows_iter = iter(rows)
+    first = next(rows_iter, None)
+    if first is None:
+        if empty_message:
+            console().print(f"[dim]{empty_message}[/dim]")
+            return
+        rows_iter = iter(())
+    else:
+        rows_iter = chain([first], rows_iter)
+    if not sys.stdout.isatty():
+        write = sys.stdout.write
+        write("\t".join(spec[0] for spec in columns) + "\n")
+        for row in rows_iter:
+            write("\t".join(row) + "\n")
+        return
+    table = _make_table(title, columns)
+    for row in rows_iter:
+        table.add_row(*row)
+    console().print(table)
+
+
+def format_bytes(value: float | int) -> str:
+    """Format bytes into human-readable form."""
+    if not value:
+        return "0 B"
+    # Pick the unit from the bit length instead of dividing in a loop.
+    magnitude = int(abs(value)).bit_length()
+    index = min(max((magnitude - 1) // 10, 0), len(_UNITS) - 1)
+    return f"{value / (1 << (10 * index)):.1f} {_UNITS[index]}"
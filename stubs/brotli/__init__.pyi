@@ -0,0 +1,2 @@
+def compress(data: bytes, quality: int = ...) -> bytes: ...
+def decompress(data: bytes) -> bytes: ...
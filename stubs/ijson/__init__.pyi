@@ -0,0 +1,4 @@
+from collections.abc import Iterator
+from typing import Any
+
+def items(source: Any, prefix: str) -> Iterator[Any]: ...
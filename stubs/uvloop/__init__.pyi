@@ -0,0 +1,5 @@
+from collections.abc import Coroutine
+from typing import Any
+
+def install() -> None: ...
+def run[T](main: Coroutine[Any, Any, T], *, debug: bool = ...) -> T: ...